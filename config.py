@@ -29,3 +29,9 @@ CREDENTIAL_FILE_PATH = os.getenv('CREDENTIAL_FILE_PATH', 'credentials.json')
 # Stat config
 STAT_FILE_NAME = os.getenv('STAT_FILE_NAME', 'stat.json')
 DEFAULT_FUNCTION_TIMEOUT = int(os.getenv('DEFAULT_FUNCTION_TIMEOUT', 1000)) # in seconds
+
+# Negative cache config
+NEGATIVE_CACHE_FILE_NAME = os.getenv('NEGATIVE_CACHE_FILE_NAME', 'negative_cache.json')
+NEGATIVE_CACHE_BASE_INTERVAL = int(os.getenv('NEGATIVE_CACHE_BASE_INTERVAL', 86400)) # in seconds
+NEGATIVE_CACHE_MAX_INTERVAL = int(os.getenv('NEGATIVE_CACHE_MAX_INTERVAL', 2592000)) # in seconds
+NEGATIVE_CACHE_PLACEHOLDER_NAMES = {name.strip().casefold() for name in os.getenv('NEGATIVE_CACHE_PLACEHOLDER_NAMES', 'na,n/a,none,null,unknown').split(',')}
@@ -4,7 +4,8 @@ import time
 
 from config import COMPANY_INDUSTRY_COLUMN, COMPANY_NAME_COLUMN, COMPANY_SIZE_COLUMN, DEFAULT_FUNCTION_TIMEOUT, LINKEDIN_PROFILE_COLUMN, SHEET_ID, SHEET_NAME, SHEETS_FILE_ID, STAT_FILE_NAME
 from custom_exceptions import timeout_handler
-from scrap import google_search, get_company_size_and_industry, linked_search, quit_driver, start_driver
+from negative_cache import clear_search_failure, record_search_failure, should_skip_search
+from scrap import SEARCH_NOT_FOUND, google_search, get_company_size_and_industry, linked_search, quit_driver, start_driver
 from sheets import google_auth, get_sheets_data, update_sheet
 
 
@@ -18,9 +19,13 @@ def get_company_details(driver, company_name, name_profile_map):
 
         The function then checks if the company_profile exists in the name_profile_map dictionary.
         If it does, it assigns the corresponding value to company_profile.
-        If not, it calls the linked_search(driver, company_name) function.
-        If that returns None, it calls the google_search(driver, company_name) function.
+        If not, and should_skip_search(company_name) reports the name as malformed or recently unresolvable,
+        both searches are skipped and company_profile is None.
+        Otherwise, it calls the linked_search(driver, company_name) function.
+        If that finds no profile, it calls the google_search(driver, company_name) function.
         The result of either function call is assigned to company_profile.
+        A name is recorded in the negative cache only if both searches finished with SEARCH_NOT_FOUND,
+        not if either errored or was blocked. A successful search clears it from the cache.
 
         If company_profile is not None, the function proceeds to clean up the URL by removing any query parameters.
         It then removes any trailing slashes from the URL and prints the search result for company_name and the cleaned up company_profile.
@@ -34,7 +39,15 @@ def get_company_details(driver, company_name, name_profile_map):
     """
     print(f'\ncompany_name: {company_name}')
     company_details = {}
-    company_profile = name_profile_map.get(company_name) or linked_search(driver, company_name) or google_search(driver, company_name)
+    company_profile = name_profile_map.get(company_name)
+    if not company_profile and not should_skip_search(company_name):
+        linkedin_result = linked_search(driver, company_name)
+        google_result = None if isinstance(linkedin_result, str) else google_search(driver, company_name)
+        company_profile = next((result for result in (linkedin_result, google_result) if isinstance(result, str)), None)
+        if company_profile:
+            clear_search_failure(company_name)
+        elif linkedin_result is SEARCH_NOT_FOUND and google_result is SEARCH_NOT_FOUND:
+            record_search_failure(company_name)
     if company_profile:
         company_profile = company_profile.split('?')[0]
         company_profile = company_profile.rstrip('/')
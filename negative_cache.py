@@ -0,0 +1,158 @@
+import json
+import os
+import re
+import time
+
+from config import NEGATIVE_CACHE_BASE_INTERVAL, NEGATIVE_CACHE_FILE_NAME, NEGATIVE_CACHE_MAX_INTERVAL, NEGATIVE_CACHE_PLACEHOLDER_NAMES
+
+
+negative_cache = None
+
+def get_cache_key(name):
+    """
+        Normalises a company name so that spacing and case variants share one cache entry.
+
+        Args:
+            name (str): The company name.
+
+        Returns:
+            str: The stripped and casefolded company name.
+    """
+    return (name or '').strip().casefold()
+
+def get_cache_entry(name):
+    """
+        Returns the negative cache entry for the company name.
+
+        Entries without an integer failures count and a numeric last checked time are treated as absent.
+
+        Args:
+            name (str): The company name.
+
+        Returns:
+            dict or None: The entry with failures and last_checked keys, or None if there is no valid entry.
+    """
+    entry = load_negative_cache().get(get_cache_key(name))
+    if not isinstance(entry, dict):
+        return None
+    failures = entry.get('failures')
+    last_checked = entry.get('last_checked')
+    if type(failures) is not int or failures < 1 or type(last_checked) not in (int, float):
+        return None
+    return entry
+
+def load_negative_cache():
+    """
+        Loads the negative cache of unresolvable company names from file.
+
+        The cache is read once and kept in memory for the rest of the run.
+        A missing or corrupted file gives an empty cache.
+
+        Returns:
+            dict: A dictionary mapping normalised company names to their failure count and last checked time.
+    """
+    global negative_cache
+    if negative_cache is None:
+        try:
+            with open(NEGATIVE_CACHE_FILE_NAME, 'r') as negative_cache_json_file:
+                negative_cache = json.load(negative_cache_json_file)
+        except (OSError, ValueError):
+            negative_cache = {}
+        if not isinstance(negative_cache, dict):
+            print(f'ignoring malformed negative cache file: {NEGATIVE_CACHE_FILE_NAME}')
+            negative_cache = {}
+    return negative_cache
+
+def save_negative_cache():
+    """
+        Writes the in-memory negative cache to file.
+
+        The cache is written to a temporary file first and then moved over the old one,
+        so an interrupted write leaves the previous cache intact.
+
+        Returns:
+            None
+    """
+    negative_cache_json_object = json.dumps(load_negative_cache(), indent=4)
+    temp_file_name = f'{NEGATIVE_CACHE_FILE_NAME}.tmp'
+    with open(temp_file_name, 'w') as negative_cache_file:
+        negative_cache_file.write(negative_cache_json_object)
+    os.replace(temp_file_name, NEGATIVE_CACHE_FILE_NAME)
+
+def is_malformed_name(name):
+    """
+        Checks if the company name can never resolve to a LinkedIn profile.
+
+        Args:
+            name (str): The company name to check.
+
+        Returns:
+            bool: True if the name is blank, only digits, only punctuation or one of NEGATIVE_CACHE_PLACEHOLDER_NAMES.
+    """
+    key = get_cache_key(name)
+    return not key or key in NEGATIVE_CACHE_PLACEHOLDER_NAMES or bool(re.fullmatch(r'[\d\s]+|[\W_]+', key))
+
+def get_recheck_interval(failures):
+    """
+        Returns the time to wait before searching again for a name that failed to resolve.
+
+        The interval doubles with each failure, starting at NEGATIVE_CACHE_BASE_INTERVAL
+        and capped at NEGATIVE_CACHE_MAX_INTERVAL.
+
+        Args:
+            failures (int): The number of consecutive failed searches.
+
+        Returns:
+            int: The re-check interval in seconds.
+    """
+    return min(NEGATIVE_CACHE_BASE_INTERVAL * 2 ** max(failures - 1, 0), NEGATIVE_CACHE_MAX_INTERVAL)
+
+def should_skip_search(name):
+    """
+        Checks if the LinkedIn and Google searches should be skipped for the company name.
+
+        Args:
+            name (str): The company name to check.
+
+        Returns:
+            bool: True if the name is malformed or failed to resolve recently enough that it is not yet due for a re-check.
+    """
+    if is_malformed_name(name):
+        print(f'skipping search for malformed company_name: {name}')
+        return True
+    entry = get_cache_entry(name)
+    if not entry:
+        return False
+    recheck_at = entry['last_checked'] + get_recheck_interval(entry['failures'])
+    if time.time() < recheck_at:
+        print(f'skipping search for company_name: {name}, failures: {entry["failures"]}, recheck in {int(recheck_at - time.time())} seconds')
+        return True
+    return False
+
+def record_search_failure(name):
+    """
+        Records a search that finished without finding the company name and saves the negative cache.
+
+        Args:
+            name (str): The company name that could not be resolved.
+
+        Returns:
+            None
+    """
+    entry = get_cache_entry(name)
+    failures = entry['failures'] if entry else 0
+    load_negative_cache()[get_cache_key(name)] = {'failures': failures + 1, 'last_checked': time.time()}
+    save_negative_cache()
+
+def clear_search_failure(name):
+    """
+        Removes the company name from the negative cache once it resolves.
+
+        Args:
+            name (str): The company name that was resolved.
+
+        Returns:
+            None
+    """
+    if load_negative_cache().pop(get_cache_key(name), None) is not None:
+        save_negative_cache()
@@ -12,6 +12,10 @@ from bs4 import BeautifulSoup
 
 from config import LINKEDIN_COOKIES_FILE_NAME, LINKEDIN_NOT_LOGGED_IN_PATHS
 
+# Returned by the search functions when the search finished but found no result.
+# Compare with `is`; None means the search errored or was blocked.
+SEARCH_NOT_FOUND = object()
+
 
 def start_driver():
     """
@@ -147,7 +151,8 @@ def linked_search(driver, name):
             name (str): The name of the company to search for.
 
         Returns:
-            str or None: The URL of the first search result, or None if no result is found.
+            str or None: The URL of the first search result, SEARCH_NOT_FOUND if the results page loaded
+                while logged in but had no result, or None if the search errored or was blocked.
     """
     try:
         print(f'\n\nLinkedin search: {name}')
@@ -159,14 +164,26 @@ def linked_search(driver, name):
         href_attribute = None
         while(not href_attribute):
             if count == 3:
-                return None
+                break
             time.sleep(1+count)
-            first_result = driver.find_element(By.CSS_SELECTOR, ".reusable-search__result-container .entity-result__title-text a")
-            if first_result:
+            try:
+                first_result = driver.find_element(By.CSS_SELECTOR, ".reusable-search__result-container .entity-result__title-text a")
                 href_attribute = first_result.get_attribute("href")
+            except NoSuchElementException:
+                # implicitly_wait already gave the page time to render the results
+                print(f'{count}. No search result, name: {name}')
+                break
             print(count, href_attribute)
-        return href_attribute
-    except:
+            count += 1
+        if href_attribute:
+            return href_attribute
+        current_url = driver.current_url
+        if '/search/results/companies' in current_url and not any(item in current_url for item in LINKEDIN_NOT_LOGGED_IN_PATHS):
+            return SEARCH_NOT_FOUND
+        print(f'LinkedIn search blocked, url: {current_url}, name: {name}')
+        return None
+    except Exception as ex:
+        print(f'LinkedIn search failed, name: {name}, ex: {ex}')
         return None
 
 def google_search(driver, name):
@@ -178,9 +195,10 @@ def google_search(driver, name):
             name (str): The name to search for.
         
         Returns:
-            str: The href attribute of the first <a> tag found on the search page, 
+            str or None: The href attribute of the first <a> tag found on the search page, 
                 which corresponds to the Google search result for the given name.
-                Returns None if no search result is found after three attempts.
+                Returns SEARCH_NOT_FOUND if the search results loaded but had no result,
+                or None if no search results loaded after three attempts.
     """
     print(f'\n\ngoogle search: {name}')
     q = f'https://www.google.com/search?q=site:linkedin.com/company/ AND "{name}"'
@@ -188,6 +206,7 @@ def google_search(driver, name):
     driver.implicitly_wait(5)
     count = 0
     href_attribute = None
+    results_loaded = False
     while count < 3 and not href_attribute:
         time.sleep(1+count)
 
@@ -215,6 +234,7 @@ def google_search(driver, name):
         cite_element = search_element.find('cite')
         if not cite_element:
             print(f"No cite_element, name: {name}")
+            results_loaded = True
             count += 1
             continue
         
@@ -227,8 +247,10 @@ def google_search(driver, name):
         # Get the 'href' attribute of the first <a> tag
         href_attribute = first_a_tag.get('href')
         print(href_attribute)
-        
-    return href_attribute
+
+    if href_attribute:
+        return href_attribute
+    return SEARCH_NOT_FOUND if results_loaded else None
 
 def scrap_page_driver(driver, url):
     """
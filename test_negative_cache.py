@@ -0,0 +1,70 @@
+import json
+import os
+import time
+
+# config reads SHEET_ID at import time
+os.environ.setdefault('SHEET_ID', '0')
+
+import pytest
+
+import negative_cache
+from negative_cache import clear_search_failure, get_recheck_interval, is_malformed_name, record_search_failure, should_skip_search
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    cache_file_path = tmp_path / 'negative_cache.json'
+    monkeypatch.setattr(negative_cache, 'NEGATIVE_CACHE_FILE_NAME', str(cache_file_path))
+    monkeypatch.setattr(negative_cache, 'NEGATIVE_CACHE_BASE_INTERVAL', 100)
+    monkeypatch.setattr(negative_cache, 'NEGATIVE_CACHE_MAX_INTERVAL', 1000)
+    monkeypatch.setattr(negative_cache, 'negative_cache', None)
+    return cache_file_path
+
+
+@pytest.mark.parametrize('name', ['', '   ', None, '1234', '12 34', '-', '---', '?!', 'NA', 'n/a', ' None ', 'null', 'Unknown'])
+def test_is_malformed_name_rejects_blank_numeric_punctuation_and_placeholders(name):
+    assert is_malformed_name(name)
+
+
+@pytest.mark.parametrize('name', ['Acme', '3M', '1&1', '84.51°', '24/7', 'xxx', 'nil', '7-Eleven'])
+def test_is_malformed_name_accepts_real_names(name):
+    assert not is_malformed_name(name)
+
+
+def test_get_recheck_interval_doubles_and_caps():
+    assert [get_recheck_interval(failures) for failures in range(1, 6)] == [100, 200, 400, 800, 1000]
+
+
+def test_should_skip_search_for_unknown_name():
+    assert not should_skip_search('Acme')
+
+
+def test_record_search_failure_skips_until_recheck(cache_file, monkeypatch):
+    record_search_failure('Acme')
+    assert should_skip_search('Acme')
+    assert json.loads(cache_file.read_text())['acme']['failures'] == 1
+
+    monkeypatch.setattr(time, 'time', lambda: json.loads(cache_file.read_text())['acme']['last_checked'] + 100)
+    assert not should_skip_search('Acme')
+
+
+def test_record_search_failure_increments_failures(cache_file):
+    record_search_failure('Acme')
+    record_search_failure('Acme')
+    assert json.loads(cache_file.read_text())['acme']['failures'] == 2
+
+
+def test_cache_key_is_normalised(cache_file):
+    record_search_failure('Acme ')
+    assert should_skip_search(' ACME')
+    clear_search_failure('acme')
+    assert not should_skip_search('Acme ')
+    assert json.loads(cache_file.read_text()) == {}
+
+
+@pytest.mark.parametrize('content', ['[]', 'not json', '{"acme": {"failures": 1}}', '{"acme": "x"}', '{"acme": {"failures": "1", "last_checked": 0}}'])
+def test_malformed_cache_file_is_ignored(cache_file, content):
+    cache_file.write_text(content)
+    assert not should_skip_search('Acme')
+    record_search_failure('Acme')
+    assert json.loads(cache_file.read_text())['acme']['failures'] == 1